@@ -13,11 +13,13 @@ Module with functions for loading and saving data files
 
 import numpy as np
 import sys
-from os.path import isfile, split, abspath, dirname, realpath, splitext
+from os.path import isfile, split, abspath, dirname, realpath, splitext, join
 from scipy.io import loadmat
 from h5py import File, Dataset
 from .audio_loader import get_audio_wave_info, get_data_audio
-from os import SEEK_END, SEEK_CUR
+from os import SEEK_END, SEEK_CUR, scandir
+from fnmatch import filter as filter_pattern
+from glob import glob
 from warnings import catch_warnings, simplefilter
 
 
@@ -50,6 +52,72 @@ def get_working_directory(path):
     return path_w
 
 
+def get_directory_name_list(data_dir):
+    """
+    Gets the names of the entries of a directory, with a single call to
+    ``os.scandir``
+
+    :param data_dir: directory to list
+    :type data_dir: str
+
+    :returns: names of the entries of the directory (not sorted), empty list
+        if the directory does not exist
+    :rtype: list
+    """
+
+    try:
+        with scandir(data_dir) as it:
+            name_list = [entry.name for entry in it]
+
+    except OSError:
+        name_list = []
+
+    return name_list
+
+
+def get_path_list_from_pattern(data_dir, pattern, name_list=None):
+    """
+    Gets the list of paths to the files in a directory with a name matching a
+    pattern
+
+    It is equivalent to ``glob(os.path.join(data_dir, pattern))``, but the
+    directory is listed with a single call to ``os.scandir`` and the pattern is
+    matched against the entries names, so that there is no system call per
+    file. If the pattern contains a path separator, then it falls back to
+    ``glob``.
+
+    :param data_dir: directory where to look for files
+    :type data_dir: str
+    :param pattern: shell-style pattern of the files names (e.g. ``"*.mp4"``)
+    :type pattern: str
+    :param name_list: names of the entries of ``data_dir`` if already listed
+        (see :func:`.get_directory_name_list`), so that a directory is listed
+        only once when looking for several patterns, by default the
+        directory is listed
+    :type name_list: list
+
+    :returns: paths to the matching files (not sorted), empty list if the
+        directory does not exist
+    :rtype: list
+    """
+
+    # check if pattern with sub-directories
+    if '/' in pattern or '\\' in pattern:
+        return glob(join(data_dir, pattern))
+
+    # list directory
+    if name_list is None:
+        name_list = get_directory_name_list(data_dir)
+
+    # hidden files are ignored, as with glob
+    if pattern[:1] != '.':
+        name_list = [name for name in name_list if name[:1] != '.']
+
+    return [
+        join(data_dir, name) for name in filter_pattern(name_list, pattern)
+    ]
+
+
 def convert_intervals_to_time_series(intervals, n_samples=0):
     """
     Converts intervals as 2D array to a time series of 0 and 1 (1D array)
@@ -338,8 +406,10 @@ def get_nb_samples_generic(path, key='', **kwargs):
                 nb_samples = shape[0]
 
     elif ext == ".txt":
+        # count lines while iterating on the file, so that lines are not
+        # stored in memory (universal newlines, as when loading data)
         with open(path, 'r') as f:
-            nb_samples = len(f.readlines())
+            nb_samples = sum(1 for _ in f)
 
     elif ext == ".wav":
         _, _, nb_samples = get_audio_wave_info(path, **kwargs)
@@ -12,13 +12,26 @@ Module with functions for date-time management
 
 
 import os
+import numpy as np
 from datetime import datetime, timedelta, time
 from pytz import timezone
 from decimal import Decimal
+from functools import lru_cache
 
 #: (*str*) Default time string format
 TIME_FMT = "%H:%M:%S"
 
+#: (*dict*) Datetime format codes that can be parsed without
+#: ``datetime.strptime``, see :func:`.get_fixed_width_format`. Key is the
+#: format code, value is a list of 3 elements: position of the field in the
+#: positional arguments of ``datetime.datetime``, width of the field and
+#: factor to apply to the field value (the code ``%s`` is for milliseconds,
+#: see :func:`.convert_string_to_datetime`)
+FIXED_WIDTH_CODE_DICT = {
+    "%Y": [0, 4, 1], "%m": [1, 2, 1], "%d": [2, 2, 1], "%H": [3, 2, 1],
+    "%M": [4, 2, 1], "%S": [5, 2, 1], "%s": [6, 3, 1000]
+}
+
 
 def convert_datetime_to_string(date_time, fmt=TIME_FMT):
     """
@@ -52,6 +65,313 @@ def convert_datetime_to_string(date_time, fmt=TIME_FMT):
     return datetime_str
 
 
+@lru_cache(maxsize=None)
+def get_fixed_width_format(fmt):
+    """
+    Gets the layout of a fixed-width datetime format, so that a datetime
+    string with this format can be converted without ``datetime.strptime``
+
+    A fixed-width format only contains the codes listed in
+    :attr:`.FIXED_WIDTH_CODE_DICT` (each one at most once, the code ``%s``
+    must be at the end) and literal characters, e.g.
+    ``"%Y-%m-%dT%H-%M-%S"``.
+
+    The layout is cached for each format, so that the format is analyzed
+    only once when converting many datetime strings with the same format.
+
+    :param fmt: datetime format
+    :type fmt: str
+
+    :returns: ``None`` if ``fmt`` is not a fixed-width format, otherwise 3
+        elements:
+
+        - (*int*) length of a datetime string with this format
+        - (*tuple*) fields of the datetime string, each element is a tuple
+          with the position of the field in the positional arguments of
+          ``datetime.datetime``, the start index and the stop index of the
+          field in the datetime string and the factor to apply to the field
+          value
+        - (*tuple*) literal characters of the datetime string, each element
+          is a tuple with the index of the character in the datetime string
+          and the character
+    :rtype: tuple
+    """
+
+    field_list = []
+    literal_list = []
+    code_list = []
+    length = 0
+    ite_char = 0
+    while ite_char < len(fmt):
+        # literal character
+        if fmt[ite_char] != '%':
+            literal_list.append((length, fmt[ite_char]))
+            length += 1
+            ite_char += 1
+
+        # literal percent
+        elif fmt[ite_char:ite_char + 2] == "%%":
+            literal_list.append((length, '%'))
+            length += 1
+            ite_char += 2
+
+        else:
+            # get format code
+            code = fmt[ite_char:ite_char + 2]
+
+            # check if format code is not fixed-width or repeated
+            if code not in FIXED_WIDTH_CODE_DICT or code in code_list:
+                return None
+
+            # check if code for milliseconds is not at the end of the format
+            if code == "%s" and ite_char + 2 < len(fmt):
+                return None
+
+            code_list.append(code)
+            pos, width, factor = FIXED_WIDTH_CODE_DICT[code]
+            field_list.append((pos, length, length + width, factor))
+            length += width
+            ite_char += 2
+
+    return length, tuple(field_list), tuple(literal_list)
+
+
+def convert_fixed_width_string_to_datetime(datetime_str, fmt):
+    """
+    Converts a datetime string with a fixed-width format to datetime, without
+    ``datetime.strptime``
+
+    See :func:`.get_fixed_width_format` for details about fixed-width
+    formats.
+
+    :param datetime_str: date-time string
+    :type datetime_str: str
+    :param fmt: datetime format
+    :type fmt: str
+
+    :returns: datetime, ``None`` if the format is not fixed-width or if the
+        datetime string does not strictly comply with the format (in this
+        case, ``datetime.strptime`` must be used)
+    :rtype: datetime.datetime
+    """
+
+    # get format layout
+    layout = get_fixed_width_format(fmt)
+    if layout is None:
+        return None
+
+    length, field_list, literal_list = layout
+
+    # check datetime string layout
+    if len(datetime_str) != length:
+        return None
+
+    for ind, char in literal_list:
+        if datetime_str[ind] != char:
+            return None
+
+    # get fields values (default values as with datetime.strptime)
+    value_list = [1900, 1, 1, 0, 0, 0, 0]
+    for pos, start, stop, factor in field_list:
+        field_str = datetime_str[start:stop]
+        if not field_str.isdigit():
+            return None
+
+        value_list[pos] = int(field_str) * factor
+
+    try:
+        date_time = datetime(*value_list)
+
+    except ValueError:
+        date_time = None
+
+    return date_time
+
+
+def convert_fixed_width_string_list_to_datetime(datetime_str_list, fmt):
+    """
+    Converts a list of datetime strings with a fixed-width format to datetimes,
+    without ``datetime.strptime``
+
+    It is equivalent to calling :func:`.convert_fixed_width_string_to_datetime`
+    on each datetime string, but the datetime strings are checked and parsed
+    all at once with numpy operations. See :func:`.get_fixed_width_format` for
+    details about fixed-width formats.
+
+    :param datetime_str_list: date-time strings
+    :type datetime_str_list: list
+    :param fmt: datetime format
+    :type fmt: str
+
+    :returns: datetimes (an element is ``None`` if the corresponding datetime
+        string does not strictly comply with the format, in this case
+        ``datetime.strptime`` must be used), ``None`` if the format is not
+        fixed-width
+    :rtype: list
+    """
+
+    # get format layout
+    layout = get_fixed_width_format(fmt)
+    if layout is None:
+        return None
+
+    length, field_list, literal_list = layout
+
+    # initialize output list
+    nb_str = len(datetime_str_list)
+    date_time_list = [None] * nb_str
+    if nb_str == 0 or length == 0:
+        return date_time_list
+
+    # check datetime strings length
+    valid_array = np.fromiter(
+        (len(datetime_str) == length for datetime_str in datetime_str_list),
+        dtype=bool, count=nb_str
+    )
+
+    # get array of characters code points, shape (nb_str, length)
+    code_array = np.array(
+        datetime_str_list, dtype="U%d" % length
+    ).view(np.uint32).reshape(nb_str, length)
+
+    # check literal characters
+    for ind, char in literal_list:
+        valid_array &= code_array[:, ind] == ord(char)
+
+    # get fields values (default values as with datetime.strptime)
+    value_array = np.tile(
+        np.array([1900, 1, 1, 0, 0, 0, 0], dtype=np.int64), (nb_str, 1)
+    )
+
+    for pos, start, stop, factor in field_list:
+        digit_array = code_array[:, start:stop].astype(np.int64) - ord('0')
+        valid_array &= np.all((digit_array >= 0) & (digit_array <= 9), axis=1)
+        value_array[:, pos] = digit_array.dot(
+            10 ** np.arange(stop - start - 1, -1, -1)
+        ) * factor
+
+    # create datetimes
+    for ind in np.where(valid_array)[0]:
+        try:
+            date_time_list[ind] = datetime(*value_array[ind].tolist())
+
+        except ValueError:
+            pass
+
+    return date_time_list
+
+
+def convert_string_list_to_datetime(datetime_str_list, fmt, time_zone=None):
+    """
+    Converts a list of datetime strings with the same format to datetimes
+
+    It is equivalent to calling :func:`.convert_string_to_datetime` on each
+    datetime string, but in case of fixed-width format (see
+    :func:`.get_fixed_width_format`) the datetime strings are parsed all at
+    once with :func:`.convert_fixed_width_string_list_to_datetime`.
+
+    :param datetime_str_list: date-time strings
+    :type datetime_str_list: list
+    :param fmt: date-time strings format, see
+        :func:`.convert_string_to_datetime`
+    :type fmt: str
+    :param time_zone: timezone compliant with package **pytz**
+    :type time_zone: str
+
+    :returns: datetimes
+    :rtype: list
+    """
+
+    # fast conversion in case of fixed-width format
+    date_time_list = None
+    if fmt != "posix":
+        date_time_list = convert_fixed_width_string_list_to_datetime(
+            datetime_str_list, fmt
+        )
+
+    if date_time_list is None:
+        date_time_list = [None] * len(datetime_str_list)
+
+    # conversion of remaining datetime strings
+    converter = get_string_to_datetime_converter(fmt)
+    for ind, (datetime_str, date_time) in enumerate(
+        zip(datetime_str_list, date_time_list)
+    ):
+        if date_time is None:
+            date_time_list[ind] = converter(datetime_str)
+
+    # timezone
+    if time_zone is not None:
+        pst = timezone(time_zone)
+        date_time_list = [
+            pst.localize(date_time) for date_time in date_time_list
+        ]
+
+    return date_time_list
+
+
+@lru_cache(maxsize=None)
+def get_string_to_datetime_converter(fmt):
+    """
+    Gets a function that converts a datetime string with a given format to a
+    naive datetime
+
+    The choice of the conversion method depending on the format (posix,
+    milliseconds code ``%s``, fixed-width format or generic
+    ``datetime.strptime``) is done once, so that the returned function can be
+    called on many datetime strings with the same format without dispatching
+    on the format at each call. Converters are cached for each format, and
+    conversions with ``datetime.strptime`` are cached for each datetime
+    string.
+
+    :param fmt: date-time string format, see
+        :func:`.convert_string_to_datetime`
+    :type fmt: str
+
+    :returns: function with one positional argument (date-time string) that
+        returns a ``datetime.datetime``
+    :rtype: function
+    """
+
+    if fmt == "posix":
+        def converter(datetime_str):
+            return datetime.fromtimestamp(int(datetime_str))
+
+    else:
+        # conversion with datetime.strptime
+        if "%s" in fmt:
+            fmt_ms = fmt.replace("%s", "%f")
+
+            def strptime_converter(datetime_str):
+                return datetime.strptime(datetime_str + "000", fmt_ms)
+
+        else:
+            def strptime_converter(datetime_str):
+                return datetime.strptime(datetime_str, fmt)
+
+        # conversions with datetime.strptime are cached, since the same
+        # datetime strings are usually found for several modalities (e.g.
+        # video and signal files recorded at the same time)
+        strptime_converter = lru_cache(maxsize=4096)(strptime_converter)
+
+        if get_fixed_width_format(fmt) is not None:
+            def converter(datetime_str):
+                # fast conversion in case of fixed-width format
+                date_time = convert_fixed_width_string_to_datetime(
+                    datetime_str, fmt
+                )
+
+                if date_time is None:
+                    date_time = strptime_converter(datetime_str)
+
+                return date_time
+
+        else:
+            converter = strptime_converter
+
+    return converter
+
+
 def convert_string_to_datetime(datetime_str, fmt, time_zone=None):
     """
     Converts datetime string to datetime
@@ -72,16 +392,7 @@ def convert_string_to_datetime(datetime_str, fmt, time_zone=None):
     """
 
     # convert string to datetime
-    if fmt == "posix":
-        date_time = datetime.fromtimestamp(int(datetime_str))
-
-    elif "%s" in fmt:
-        fmt = fmt.replace("%s", "%f")
-        datetime_str += "000"
-        date_time = datetime.strptime(datetime_str, fmt)
-
-    else:
-        date_time = datetime.strptime(datetime_str, fmt)
+    date_time = get_string_to_datetime_converter(fmt)(datetime_str)
 
     # timezone
     if time_zone is not None:
@@ -134,7 +445,7 @@ def get_datetime_from_path(
         # check split length
         if len(basename_split) >= datetime_pos + 1:
             # get datetime string
-            datetime_str = basename.split(datetime_del)[datetime_pos]
+            datetime_str = basename_split[datetime_pos]
 
             date_time = convert_string_to_datetime(
                 datetime_str, fmt, **kwargs
@@ -143,6 +454,95 @@ def get_datetime_from_path(
     return date_time
 
 
+def get_datetime_list_from_path_list(
+    path_list, datetime_del, datetime_pos, fmt, **kwargs
+):
+    """
+    Gets datetimes contained in file names
+
+    It is equivalent to calling :func:`.get_datetime_from_path` on each path,
+    but the datetime strings are converted all at once with
+    :func:`.convert_string_list_to_datetime`.
+
+    :param path_list: paths where to find datetime
+    :type path_list: list
+    :param datetime_del: delimiter to get beginning datetime in the file names
+    :type datetime_del: str
+    :param datetime_pos: position of the beginning datetime in the file names,
+        according to the delimiter
+    :type datetime_pos: str
+    :param fmt: format of the beginning datetime in the file names, see
+        :func:`.get_datetime_from_path`
+    :type fmt: str
+    :param kwargs: keyword arguments of
+        :func:`.convert_string_list_to_datetime`
+
+    :returns: datetimes (``datetime(2000, 1, 1, 0, 0, 0)`` for a path where
+        datetime is not found)
+    :rtype: list
+    """
+
+    date_time_list = [datetime(2000, 1, 1, 0, 0, 0)] * len(path_list)
+
+    if datetime_del is not None and datetime_pos is not None \
+            and fmt is not None:
+        # get datetime strings in the files basenames
+        ind_list = []
+        datetime_str_list = []
+        for ind, path in enumerate(path_list):
+            basename_split = os.path.splitext(
+                os.path.basename(path)
+            )[0].split(datetime_del)
+
+            # check split length
+            if len(basename_split) >= datetime_pos + 1:
+                ind_list.append(ind)
+                datetime_str_list.append(basename_split[datetime_pos])
+
+        # convert datetime strings
+        for ind, date_time in zip(ind_list, convert_string_list_to_datetime(
+            datetime_str_list, fmt, **kwargs
+        )):
+            date_time_list[ind] = date_time
+
+    return date_time_list
+
+
+def convert_datetime_list_to_timestamp_array(datetime_list):
+    """
+    Converts a list of datetimes to an array of timestamps, so that datetimes
+    can be compared, sorted or subtracted with numpy operations
+
+    Timestamps are the number of microseconds since 1970-01-01 00:00:00 (UTC
+    for timezone-aware datetimes), as integers so that differences of
+    timestamps are exact. A naive datetime is considered as UTC, so that
+    conversion does not depend on the local timezone of the computer.
+
+    :param datetime_list: datetimes, they must be all timezone-aware or all
+        naive
+    :type datetime_list: list
+
+    :returns: timestamps in microseconds
+    :rtype: numpy array
+    """
+
+    # reference datetimes
+    epoch = datetime(1970, 1, 1)
+    epoch_utc = timezone("UTC").localize(epoch)
+    microsecond = timedelta(microseconds=1)
+
+    return np.fromiter(
+        (
+            (
+                date_time - (
+                    epoch if date_time.tzinfo is None else epoch_utc
+                )
+            ) // microsecond for date_time in datetime_list
+        ),
+        dtype=np.int64, count=len(datetime_list)
+    )
+
+
 def convert_seconds_to_time(time_sec):
     """
     Converts time in seconds to time as hour/minute/second/microsecond
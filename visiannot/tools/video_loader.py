@@ -117,6 +117,27 @@ def get_data_video(path):
         return None, 0, -1
 
 
+def get_fps_video(path):
+    """
+    Gets frame rate of a video file with openCV, the video stream is released
+    right after reading the frame rate in the metadata
+
+    :param path: path to the video file
+    :type path: str
+
+    :returns: frame rate of the video (-1 if video file does not exist)
+    :rtype: int or float
+    """
+
+    data_video, _, fps = get_data_video(path)
+
+    # release video stream
+    if data_video is not None:
+        data_video.release()
+
+    return fps
+
+
 def get_duration_video(path):
     """
     Gets duration of a video file
@@ -424,6 +424,14 @@ class ViSiAnnoT():
             #: (*int*) Reference frequency
             self.fps = None
 
+            #: (*dict*) Frequencies of data files read in the files (.wav file
+            #: or file attribute), so that each file is read only once
+            #:
+            #: Key is a tuple with the path to the data file and the frequency
+            #: configuration, value is the frequency. It is filled by
+            #: :meth:`.get_data_frequency`.
+            self.data_frequency_dict = {}
+
         #: (*int*) Number of frames in the video (or the first signal if there
         #: is no video)
         self.nframes = None
@@ -983,8 +991,9 @@ class ViSiAnnoT():
 
     def stop_processing(self):
         """
-        Closes streams (elements of :attr:`.video_data_dict`) and
-        deletes temporary signal folder
+        Closes streams (elements of :attr:`.video_data_dict`) and waits for
+        temporary synchronization files to be written (in case of long
+        recording)
 
         It sets the value of :attr:`.flag_processing` to ``False`` so
         that the thread :attr:`.update_frame_thread` is stopped.
@@ -1038,10 +1047,15 @@ class ViSiAnnoT():
             if vid_wid.data_video is not None:
                 vid_wid.data_video.release()
 
-        # delete temporary files
+        # temporary synchronization files are kept in case of long recording,
+        # so that they are reused if the same long recording is launched again
+        # (see ViSiAnnoTLongRec.set_synchronization_directory)
         if self.flag_long_rec:
-            print("delete temporary signal files")
-            rmtree(self.synchro_dir, ignore_errors=True)
+            self.duration_executor.shutdown(wait=True)
+            self.synchro_executor.shutdown(wait=True)
+
+            # keep durations of data files for the next launch
+            self.save_duration_cache()
 
 
     def update_plot(self):
@@ -1800,6 +1814,10 @@ class ViSiAnnoT():
         self.sig_dict = {}
         self.interval_dict = {}
 
+        # initialize dictionary with number of frames and fps of each video
+        # (not long recording), so that video files are opened only once
+        video_info_dict = {}
+
         # loop on video
         for video_id, video_config in video_dict.items():
             # check number of elements in configuration
@@ -1816,7 +1834,8 @@ class ViSiAnnoT():
 
             else:
                 # get video data
-                data_video, _, _ = get_data_video(path)
+                data_video, nframes, fps = get_data_video(path)
+                video_info_dict[video_id] = (nframes, fps)
                 video_name = os.path.splitext(os.path.basename(path))[0]
                 self.video_data_dict[video_id] = (data_video, video_name)
 
@@ -1849,8 +1868,9 @@ class ViSiAnnoT():
                     # get video configuration
                     path, delimiter, pos, fmt = video_config
 
-                    # get number of frames and fps
-                    _, nframes, fps = get_data_video(path)
+                    # get number of frames and fps (already read when
+                    # loading video data)
+                    nframes, fps = video_info_dict[video_id]
 
                     # check if FPS OK
                     if fps > 0:
@@ -1871,8 +1891,8 @@ class ViSiAnnoT():
 
             else:
                 # get first signal configuration
-                signal_id = list(signal_dict.keys())[0]
-                signal_config = list(signal_dict.values())[0][0]
+                signal_id, signal_config_list = next(iter(signal_dict.items()))
+                signal_config = signal_config_list[0]
 
                 # check number of elements in first signal configuration
                 check_configuration(
@@ -1909,6 +1929,53 @@ class ViSiAnnoT():
 
         # loop on signals
         for signal_id, signal_config_list in signal_dict.items():
+            # ********************** load intervals ************************* #
+            if signal_id in interval_dict.keys():
+                # initialize dictionary value
+                self.interval_dict[signal_id] = []
+
+                # loop on intervals paths
+                for interval_config in interval_dict[signal_id]:
+                    # check number of elements in interval configuration
+                    check_configuration(
+                        signal_id, interval_config, "Interval",
+                        flag_long_rec=False
+                    )
+
+                    # get configuration
+                    path_interval, delimiter_interval, pos_interval, \
+                        fmt_interval, key_interval, freq_interval, \
+                        color_interval = interval_config
+
+                    # get frequency
+                    freq_interval = self.get_data_frequency(
+                        path_interval, freq_interval
+                    )
+
+                    # check if long recording
+                    if self.flag_long_rec:
+                        # load intervals data
+                        interval, _ = self.get_synchro_signal(
+                            path_interval, delimiter_interval,
+                            pos_interval, fmt_interval, key_interval,
+                            freq_interval, signal_id, flag_interval=True
+                        )
+
+                        # check if empty
+                        if interval is None:
+                            interval = np.empty((0,))
+
+                    else:
+                        # load intervals data
+                        interval = data_loader.get_data_interval(
+                            path_interval, key_interval
+                        )
+
+                    # update dictionary value
+                    self.interval_dict[signal_id].append(
+                        [interval, freq_interval, color_interval]
+                    )
+
             # initialize temporary list
             sig_list_tmp = []
 
@@ -1923,53 +1990,6 @@ class ViSiAnnoT():
                 path_data, delimiter, pos, fmt, key_data, freq_data, \
                     plot_style = signal_config
 
-                # ******************** load intervals *********************** #
-                if signal_id in interval_dict.keys():
-                    # initialize dictionary value
-                    self.interval_dict[signal_id] = []
-
-                    # loop on intervals paths
-                    for interval_config in interval_dict[signal_id]:
-                        # check number of elements in interval configuration
-                        check_configuration(
-                            signal_id, interval_config, "Interval",
-                            flag_long_rec=False
-                        )
-
-                        # get configuration
-                        path_interval, delimiter_interval, pos_interval, \
-                            fmt_interval, key_interval, freq_interval, \
-                            color_interval = interval_config
-
-                        # get frequency
-                        freq_interval = self.get_data_frequency(
-                            path_interval, freq_interval
-                        )
-
-                        # check if long recording
-                        if self.flag_long_rec:
-                            # load intervals data
-                            interval, _ = self.get_synchro_signal(
-                                path_interval, delimiter_interval,
-                                pos_interval, fmt_interval, key_interval,
-                                freq_interval, signal_id, flag_interval=True
-                            )
-
-                            # check if empty
-                            if interval is None:
-                                interval = np.empty((0,))
-
-                        else:
-                            # load intervals data
-                            interval = data_loader.get_data_interval(
-                                path_interval, key_interval
-                            )
-
-                        # update dictionary value
-                        self.interval_dict[signal_id].append(
-                            [interval, freq_interval, color_interval]
-                        )
-
                 # ********************** load data ************************** #
                 # check if long recording
                 if self.flag_long_rec:
@@ -2035,23 +2055,67 @@ class ViSiAnnoT():
             frequency in a H5 file)
         :type freq: str or float
 
+        If the frequency is read in the file (.wav file or file attribute), it
+        is stored in :attr:`.data_frequency_dict` so that the file is not read
+        again.
+
         :returns: data frequency
         :rtype: float
         """
 
-        # get frequency if necessary
-        if os.path.splitext(path)[1] == ".wav":
-            _, freq, _ = get_audio_wave_info(path)
+        # get file extension
+        ext = os.path.splitext(path)[1]
+
+        # check if frequency must be read in the file
+        if ext == ".wav" or isinstance(freq, str):
+            # check if frequency already read
+            if (path, freq) in self.data_frequency_dict:
+                return self.data_frequency_dict[(path, freq)]
+
+            # get frequency
+            if ext == ".wav":
+                _, freq_file, _ = get_audio_wave_info(path)
+
+            else:
+                freq_file = data_loader.get_attribute_generic(path, freq)
+
+            # store frequency
+            self.data_frequency_dict[(path, freq)] = freq_file
 
-        elif isinstance(freq, str):
-            freq = data_loader.get_attribute_generic(path, freq)
+            return freq_file
 
+        # data frequency is the same as reference frequency
         elif freq == -1:
             freq = self.fps
 
         return freq
 
 
+    def get_synchro_lines(self, path):
+        """
+        In case of long recording, gets the lines of a temporary
+        synchronization file
+
+        The lines are retrieved in the attribute
+        :attr:`.ViSiAnnoTLongRec.synchro_lines_dict` if the file is in it,
+        otherwise the file is read.
+
+        :param path: path to the temporary synchronization file
+        :type path: str
+
+        :returns: lines of the temporary synchronization file
+        :rtype: list
+        """
+
+        if path in self.synchro_lines_dict:
+            lines = self.synchro_lines_dict[path]
+
+        else:
+            lines = data_loader.get_txt_lines(path)
+
+        return lines
+
+
     def get_synchro_info_signal(self, line):
         """
         In case of long recording, gets the path to data file and the start
@@ -2120,6 +2184,9 @@ class ViSiAnnoT():
         It is assumed that all videos have the same frequency, stored as
         reference frequency in attribute :attr:`.fps`.
 
+        Video names are retrieved in the attribute
+        :attr:`.ViSiAnnoTLongRec.video_name_dict`.
+
         :param path: path to the current temporary synchronization file
         :type path: str
 
@@ -2135,12 +2202,12 @@ class ViSiAnnoT():
               the video spans in the current file of the long recording
         """
 
-        # read temporary file
-        lines = data_loader.get_txt_lines(path)
+        # get lines of temporary file
+        lines = self.get_synchro_lines(path)
 
         video_data_list = []
         path_list = []
-        frame_array = np.empty((0, 2), dtype=int)
+        frame_list = []
 
         # check if any video
         if len(lines) > 0:
@@ -2150,22 +2217,20 @@ class ViSiAnnoT():
                 vid_path, start_sec, end_sec = \
                     self.get_synchro_info_video(line)
 
-                # get video name
-                path_list.append(
-                    os.path.splitext(os.path.basename(vid_path))[0]
-                )
+                # get video name (computed once in ViSiAnnoTLongRec)
+                path_list.append(self.video_name_dict[vid_path])
 
                 # get video data
                 video_data_list.append(get_data_video(vid_path)[0])
 
                 # get start/end frame
-                frame_array = np.concatenate((
-                    frame_array,
-                    np.array(
-                        [[int(start_sec * self.fps), int(end_sec * self.fps)]]
-                    )
-                ), axis=0)
-                
+                frame_list.append(
+                    [int(start_sec * self.fps), int(end_sec * self.fps)]
+                )
+
+        # convert start/end frames to array once (shape (0, 2) if no video)
+        frame_array = np.array(frame_list, dtype=int).reshape(-1, 2)
+
         return video_data_list, path_list, frame_array
 
 
@@ -2205,8 +2270,8 @@ class ViSiAnnoT():
             - **freq_data** (*float*) -- signal frequency
         """
 
-        # read temporary file
-        lines = data_loader.get_txt_lines(path)
+        # get lines of temporary file
+        lines = self.get_synchro_lines(path)
 
         # check if empty data
         if len(lines) == 0:
@@ -13,17 +13,20 @@ Module defining :class:`.ViSiAnnoTLongRec`
 
 import numpy as np
 import os
-from glob import glob
+import json
 from datetime import timedelta
 from ..tools import pyqt_overlayer
 from ..tools import datetime_converter
 from ..tools import data_loader
-from ..tools.video_loader import get_duration_video, get_data_video
+from ..tools.video_loader import get_duration_video, get_fps_video
 from .ViSiAnnoT import ViSiAnnoT
 from ..configuration import check_configuration
 from .components.LogoWidgets import PreviousWidget, NextWidget
 from .components.FileSelectionWidget import FileSelectionWidget
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from hashlib import sha256
+from locale import getpreferredencoding
 
 
 class ViSiAnnoTLongRec(ViSiAnnoT):
@@ -176,47 +179,12 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         #: the video paths become the path to temporary synchronization files.
         self.video_list_dict = {}
 
-        # get list of video paths and beginning datetimes for each camera
-        self.set_video_list_dict(video_dict, time_zone=time_zone)
-
-        # ******************************************************************* #
-        # ********************* reference frequency ************************* #
-        # ******************************************************************* #
-
-        # check if any video
-        if any(video_dict):
-            # get fps
-            ite_vid = 0
-            path_list = list(self.video_list_dict.values())[0][0]
-            self.fps = 0
-            while self.fps <= 0:
-                _, _, self.fps = get_data_video(path_list[ite_vid])
-                ite_vid += 1
-
-        # no video
-        else:
-            # get first signal configuration
-            signal_id = list(signal_dict.keys())[0]
-            signal_config = list(signal_dict.values())[0][0]
-
-            # check number of elements in first signal configuration
-            check_configuration(signal_id, signal_config, "Signal")
-
-            # get info for first signal
-            data_dir, pattern, _, _, _, _, freq, _ = signal_config
-
-            # get list of signal files paths
-            data_list_tmp = glob('%s/%s' % (data_dir, pattern))
-
-            # check if any file
-            if len(data_list_tmp) == 0:
-                raise Exception(
-                    "Empty directory for first signal: %s - %s" %
-                    (pattern, data_dir)
-                )
-
-            # store frequency as the reference frequency
-            self.fps = self.get_data_frequency(data_list_tmp[0], freq)
+        #: (*dict*) Key is the path to a video file of the long recording.
+        #: Value is the video file name without extension
+        #:
+        #: It is filled by :meth:`.set_video_list_dict` so that video names are
+        #: not computed again each time the file in the long recording changes.
+        self.video_name_dict = {}
 
 
         # ******************************************************************* #
@@ -225,11 +193,10 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
 
         #: (*dict*) Key is a data type, corresponding to a signal widget. Value
         #: is the corresponding configuration list without data path
-        self.signal_config_dict = {}
-        for signal_id, config_list in signal_dict.items():
-            self.signal_config_dict[signal_id] = []
-            for config in config_list:
-                self.signal_config_dict[signal_id].append(config[2:])
+        self.signal_config_dict = {
+            signal_id: [config[2:] for config in config_list]
+            for signal_id, config_list in signal_dict.items()
+        }
 
         #: (*dict*) Key is a data type, corresponding to a signal widget. Value
         #: is a list (along the signals in the widget) of lists of length 2:
@@ -242,11 +209,10 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         #: (*dict*) Key is a data type, corresponding to a signal widget on
         #: which to plot intervals. Value is the corresponding configuration
         #: list without data path
-        self.interval_config_dict = {}
-        for interval_id, config_list in interval_dict.items():
-            self.interval_config_dict[interval_id] = []
-            for config in config_list:
-                self.interval_config_dict[interval_id].append(config[2:])
+        self.interval_config_dict = {
+            interval_id: [config[2:] for config in config_list]
+            for interval_id, config_list in interval_dict.items()
+        }
 
         #: (*dict*) Key is a data type, corresponding to a signal widget on
         #: which to plot intervals. Value is a list (along the intervals types
@@ -257,21 +223,125 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         #: the video paths become the path to temporary synchronization files.
         self.interval_list_dict = {}
 
-        # get list of data paths and beginning datetimes for each signal and
-        # interval
-        self.set_signal_interval_list(
-            signal_dict, interval_dict, time_zone=time_zone
-        )
+        # get list of video paths and beginning datetimes for each camera, in
+        # a separate thread so that it is done while listing the data files of
+        # signals and intervals (directory listings are independent from each
+        # other)
+        with ThreadPoolExecutor(max_workers=1) as video_list_executor:
+            video_list_future = video_list_executor.submit(
+                self.set_video_list_dict, video_dict, time_zone=time_zone
+            )
+
+            # get list of data paths and beginning datetimes for each signal
+            # and interval
+            try:
+                self.set_signal_interval_list(
+                    signal_dict, interval_dict, time_zone=time_zone
+                )
+
+            # wait for the list of video paths and beginning datetimes, even
+            # if listing signals and intervals failed, so that an exception
+            # raised when listing videos is not hidden
+            finally:
+                video_list_future.result()
+
+
+        # ******************************************************************* #
+        # ********************* reference frequency ************************* #
+        # ******************************************************************* #
+
+        #: (*dict*) Frequencies of data files read in the files, see
+        #: :meth:`.ViSiAnnoT.get_data_frequency`
+        self.data_frequency_dict = {}
+
+        # check if any video
+        if any(video_dict):
+            # get fps of the first readable video of the first camera
+            video_id, video_list = next(iter(self.video_list_dict.items()))
+            self.fps = 0
+            for path in video_list[0]:
+                self.fps = get_fps_video(path)
+                if self.fps > 0:
+                    break
+
+            # check if fps found
+            if self.fps <= 0:
+                raise Exception(
+                    "No readable video file for camera %s, cannot get the "
+                    "reference frequency" % video_id
+                )
+
+        # no video
+        else:
+            # get first signal configuration (already checked when listing
+            # data files)
+            signal_id, signal_config_list = next(iter(signal_dict.items()))
+            data_dir, pattern, _, _, _, _, freq, _ = signal_config_list[0]
+
+            # get list of signal files paths (already listed)
+            data_list_tmp = self.signal_list_dict[signal_id][0][0]
+
+            # check if any file
+            if len(data_list_tmp) == 0:
+                raise Exception(
+                    "Empty directory for first signal: %s - %s" %
+                    (pattern, data_dir)
+                )
+
+            # store frequency as the reference frequency
+            self.fps = self.get_data_frequency(data_list_tmp[0], freq)
 
 
         # ******************************************************************* #
         # *********************** synchronization *************************** #
         # ******************************************************************* #
 
+        #: (*str*) Directory where to save temporary files for synchronization
+        self.synchro_dir = "sig-tmp"
+
+        #: (*dict*) Key is the path to a data file. Value is a tuple with the
+        #: size and the modification time of the data file, ``None`` if the
+        #: data file cannot be accessed
+        #:
+        #: It is filled by :meth:`.get_file_info`, so that each data file is
+        #: accessed only once for both :meth:`.get_synchronization_hash` and
+        #: :meth:`.get_cached_duration`.
+        self.file_info_dict = {}
+
+        #: (*dict*) Key is a tuple with the path to a data file and the
+        #: arguments for getting its duration. Value is a tuple of length 2:
+        #: tuple with the size and the modification time of the data file,
+        #: and the duration of the data file in seconds
+        #:
+        #: It is filled by :meth:`.get_cached_duration` and it is kept in the
+        #: JSON file ``.duration_cache`` of :attr:`.synchro_dir` (see
+        #: :meth:`.load_duration_cache` and :meth:`.save_duration_cache`), so
+        #: that the durations of data files are not retrieved again when the
+        #: long recording is launched again, even if some data files have
+        #: changed in the meantime.
+        self.duration_cache_dict = {}
+
+        #: (*bool*) Specify if :attr:`.duration_cache_dict` has been updated
+        #: since it was loaded
+        self.flag_duration_cache_update = False
+
+        # load durations of data files retrieved in a previous launch
+        self.load_duration_cache()
+
         # get temporal bounds of the long recording
         beginning_datetime_long, ending_datetime_long = \
             self.get_recording_temporal_bounds(signal_dict)
 
+        # get number of files splitting the long recording (the last one
+        # might be shorter)
+        ref_step = timedelta(seconds=self.temporal_range_duration_split)
+        nb_ref, ref_remainder = divmod(
+            ending_datetime_long - beginning_datetime_long, ref_step
+        )
+
+        if ref_remainder > timedelta(0):
+            nb_ref += 1
+
         #: (*list*) Beginning datetimes of the files splitting in the long
         #: recording
         #:
@@ -280,12 +350,32 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         #: beginning datetimes of the files splitting starts at the beginning
         #: of the long recording and is incremented by
         #: :attr:`.temporal_range_duration`.
-        self.ref_beg_datetime_list = []
-        ref_datetime = beginning_datetime_long
-        while ref_datetime < ending_datetime_long:
-            self.ref_beg_datetime_list.append(ref_datetime)
-            ref_datetime = ref_datetime + \
-                timedelta(seconds=self.temporal_range_duration_split)
+        self.ref_beg_datetime_list = [
+            beginning_datetime_long + ref_step * ite_ref
+            for ite_ref in range(nb_ref)
+        ]
+
+        #: (*numpy array*) Beginning timestamps (microseconds) of the files
+        #: splitting in the long recording, same length as
+        #: :attr:`.ref_beg_datetime_list`, so that temporal offsets of data
+        #: files with respect to reference files are computed with numpy
+        #: (see :func:`.convert_datetime_list_to_timestamp_array`)
+        self.ref_beg_timestamp_array = \
+            datetime_converter.convert_datetime_list_to_timestamp_array(
+                [beginning_datetime_long]
+            )[0] + (ref_step // timedelta(microseconds=1)) * np.arange(
+                nb_ref, dtype=np.int64
+            )
+
+        #: (*list*) Beginning datetimes of the files splitting in the long
+        #: recording as strings (format ``"%Y-%m-%dT%H-%M-%S"``), same length
+        #: as :attr:`.ref_beg_datetime_list`, used in the names of the
+        #: temporary synchronization files (see
+        #: :meth:`.get_synchronization_path`)
+        self.ref_beg_datetime_str_list = [
+            ref_datetime.strftime("%Y-%m-%dT%H-%M-%S")
+            for ref_datetime in self.ref_beg_datetime_list
+        ]
 
         #: (*float*) Temporal range duration of the last file in the long
         #: recording (it might be lower than :attr:`.temporal_range_duration`)
@@ -293,6 +383,17 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
             ending_datetime_long - self.ref_beg_datetime_list[-1]
         ).total_seconds()
 
+        #: (*numpy array*) Ending timestamps (microseconds) of the files
+        #: splitting in the long recording, same length as
+        #: :attr:`.ref_beg_timestamp_array`
+        ref_duration_array = np.full(
+            len(self.ref_beg_datetime_list),
+            self.temporal_range_duration_split, dtype=np.float64
+        )
+        ref_duration_array[-1] = self.temporal_range_duration_last
+        self.ref_end_timestamp_array = self.ref_beg_timestamp_array + \
+            np.rint(ref_duration_array * 1e6)
+
         #: (*float*) Temporal range duration of the current file in the long
         #: recording (equal to :attr:`.temporal_range_duration_last` if last
         #: file, otherwise equal to :attr:`.temporal_range_duration_split`)
@@ -310,9 +411,6 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         #: set to 1.
         self.nb_files = len(self.ref_beg_datetime_list)
 
-        #: (*str*) Directory where to save temporary files for synchronization
-        self.synchro_dir = "sig-tmp"
-
         #: (*str*) Delimiter for parsing temporary files for synchronization
         self.synchro_delimiter = " *=* "
 
@@ -320,18 +418,60 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         #: synchronization files (delimiter, index, format)
         self.synchro_timestamp_config = ['_', -1, "%Y-%m-%dT%H-%M-%S"]
 
-        # create temporary directory for temporary synchronization files
-        if not os.path.isdir(self.synchro_dir):
-            os.mkdir(self.synchro_dir)
+        #: (*dict*) Key is the path to a temporary synchronization file. Value
+        #: is the list of lines written in the file
+        #:
+        #: It is filled by :meth:`.create_synchronization_file`, so that
+        #: :meth:`.ViSiAnnoT.get_synchro_lines` does not need to read the
+        #: temporary synchronization files when changing file in the long
+        #: recording.
+        self.synchro_lines_dict = {}
+
+        #: (*dict*) Key is a modality name (used in the names of the temporary
+        #: synchronization files). Value is a list of 6 elements for creating
+        #: the temporary synchronization files of the modality when needed:
+        #:
+        #: - (*str*) synchronization format
+        #: - (*list*) paths to the data files
+        #: - (*numpy array*) beginning timestamps of the data files in
+        #:   microseconds
+        #: - (*numpy array*) ending timestamps of the data files in
+        #:   microseconds, ``nan`` if not retrieved yet (see
+        #:   :meth:`.get_synchronization_ending_timestamps`)
+        #: - (*function*) function for getting the duration of a data file
+        #: - (*numpy array*) shape :math:`(n_{files}, 2)`, for each file in
+        #:   the long recording, index of the first data file beginning in its
+        #:   temporal range and index following the last one
+        #:
+        #: It is filled by :meth:`.set_synchronization_data`, see
+        #: :meth:`.create_synchronization_file`.
+        self.synchro_data_dict = {}
+
+        #: (*concurrent.futures.ThreadPoolExecutor*) Threads for writing
+        #: temporary synchronization files, so that the lines of the files
+        #: (stored in :attr:`.synchro_lines_dict`) can be used without waiting
+        #: for the files to be written
+        self.synchro_executor = ThreadPoolExecutor(max_workers=4)
+
+        #: (*concurrent.futures.ThreadPoolExecutor*) Threads for retrieving
+        #: the durations of data files to synchronize in parallel (see
+        #: :meth:`.get_synchronization_ending_timestamps`), created once and
+        #: reused for all modalities and all files in the long recording
+        self.duration_executor = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4)
+        )
 
-        # delete content from temporary directory
-        else:
-            from shutil import rmtree
-            rmtree(self.synchro_dir, ignore_errors=True)
-            os.mkdir(self.synchro_dir)
+        #: (*bool*) Specify if the temporary synchronization files already in
+        #: :attr:`.synchro_dir` are up to date and can be reused, see
+        #: :meth:`.set_synchronization_directory`
+        self.flag_synchro_reuse = False
 
-        # synchronize videos, signals and intervals by creating temporary
-        # synchronization files
+        # create temporary directory for temporary synchronization files, or
+        # clean it if synchronization inputs have changed
+        self.set_synchronization_directory()
+
+        # set data for synchronizing videos, signals and intervals (temporary
+        # synchronization files are created when needed)
         self.process_synchronization_all()
 
 
@@ -464,7 +604,7 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
     @staticmethod
     def get_path_list(
         config_id, config, config_type, flag_raise_exception=False,
-        **kwargs
+        name_list=None, flag_check_configuration=True, **kwargs
     ):
         """
         Gets list of paths and list of beginning datetimes along the recording
@@ -481,7 +621,15 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         :param flag_raise_exception: specify if an exception must be raised i
             case no file is found
         :type flag_raise_exception: bool
-        :param kwargs: keyword arguments of :func:`.get_datetime_from_path`
+        :param name_list: names of the entries of the data directory if
+            already listed, see :func:`.get_path_list_from_pattern`
+        :type name_list: list
+        :param flag_check_configuration: specify if the number of elements in
+            the configuration list must be checked, set it to ``False`` if
+            already checked
+        :type flag_check_configuration: bool
+        :param kwargs: keyword arguments of
+            :func:`.get_datetime_list_from_path_list`
 
         :returns: 2 elements:
 
@@ -492,13 +640,16 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         """
 
         # check number of elements in configuration
-        check_configuration(config_id, config, config_type)
+        if flag_check_configuration:
+            check_configuration(config_id, config, config_type)
 
         # get configuration
         data_dir, pattern, delimiter, pos, fmt = config[:5]
 
         # get list of data paths
-        path_list = sorted(glob("%s/%s" % (data_dir, pattern)))
+        path_list = sorted(data_loader.get_path_list_from_pattern(
+            data_dir, pattern, name_list=name_list
+        ))
 
         # check if any data file
         if flag_raise_exception and path_list == []:
@@ -507,23 +658,22 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
                 (config_type, config_id, pattern, data_dir)
             )
 
-        # initialize list of beginning datetime of data files
-        datetime_list = []
-
-        # loop on data files paths
-        for path in path_list:
-            # get beginning datetime of the video file
-            beginning_datetime = datetime_converter.get_datetime_from_path(
-                path, delimiter, pos, fmt, **kwargs
-            )
-
-            # append list
-            datetime_list.append(beginning_datetime)
+        # get beginning datetimes of data files
+        datetime_list = datetime_converter.get_datetime_list_from_path_list(
+            path_list, delimiter, pos, fmt, **kwargs
+        )
 
-        # sort data paths by chronological order
-        sort_indexes = np.argsort(datetime_list)
-        path_list = [path_list[i] for i in sort_indexes]
-        datetime_list = [datetime_list[i] for i in sort_indexes]
+        # sort data paths by chronological order, unless already sorted
+        # (usual case since paths are sorted alphabetically and datetimes in
+        # file names are often ISO-like), paths with the same datetime remain
+        # in alphabetical order
+        if any(
+            datetime_next < datetime_prev for datetime_prev, datetime_next
+            in zip(datetime_list, datetime_list[1:])
+        ):
+            data_list = sorted(zip(datetime_list, path_list))
+            datetime_list = [data[0] for data in data_list]
+            path_list = [data[1] for data in data_list]
 
         return [path_list, datetime_list]
 
@@ -533,7 +683,8 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         Finds the list of video files (path and beginning datetime) in the
         long recording
 
-        It sets the attribute :attr:`.video_list_dict`.
+        It sets the attributes :attr:`.video_list_dict` and
+        :attr:`.video_name_dict`.
 
         :param video_dict: see first positional argument of
             :class:`.ViSiAnnoTLongRec`
@@ -543,14 +694,35 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
 
         # initialize dictionaries
         self.video_list_dict = {}
+        self.video_name_dict = {}
+
+        # check number of elements in configurations before listing any
+        # directory
+        for video_id, config in video_dict.items():
+            check_configuration(video_id, config, "Video")
+
+        # get list of video paths and beginning datetimes for all cameras
+        # (parallelization to improve performance, directory listings are
+        # independent from each other)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(8, len(video_dict)))
+        ) as executor:
+            video_list_list = list(executor.map(
+                lambda video_item: self.get_path_list(
+                    video_item[0], video_item[1], "Video",
+                    flag_raise_exception=True, flag_check_configuration=False,
+                    **kwargs
+                ), video_dict.items()
+            ))
 
         # loop on cameras
-        for ite_id, (video_id, video_config) in enumerate(video_dict.items()):
-            # get list of video paths and beginning datetimes
-            self.video_list_dict[video_id] = self.get_path_list(
-                video_id, video_config, "Video", flag_raise_exception=True,
-                **kwargs
-            )
+        for video_id, video_list in zip(video_dict.keys(), video_list_list):
+            self.video_list_dict[video_id] = video_list
+
+            # get video file names
+            for path in self.video_list_dict[video_id][0]:
+                self.video_name_dict[path] = \
+                    os.path.splitext(os.path.basename(path))[0]
 
 
     def set_signal_interval_list(self, signal_dict, interval_dict, **kwargs):
@@ -574,32 +746,73 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         self.signal_list_dict = {}
         self.interval_list_dict = {}
 
-        # loop on data types
+        # get list of configurations to process, each element is a list with
+        # widget identifier, configuration and configuration type
+        config_list = []
         for signal_id, data_info_list in signal_dict.items():
             # check if there are intervals
             if signal_id in interval_dict.keys():
-                # loop on interval configurations for current signal
-                interval_list_tmp = []
+                self.interval_list_dict[signal_id] = []
                 for data_info in interval_dict[signal_id]:
-                    # get list of interval files
-                    interval_list_tmp.append(
-                        self.get_path_list(
-                            signal_id, data_info, "Interval", **kwargs
-                        )
-                    )
-
-                self.interval_list_dict[signal_id] = interval_list_tmp
+                    config_list.append([signal_id, data_info, "Interval"])
 
-            # loop on signal configurations for current signal
-            signal_list_tmp = []
+            self.signal_list_dict[signal_id] = []
             for data_info in data_info_list:
-                signal_list_tmp.append(
-                    self.get_path_list(
-                        signal_id, data_info, "Signal", **kwargs
-                    )
+                config_list.append([signal_id, data_info, "Signal"])
+
+        # get configurations with distinct data files (same directory,
+        # pattern and datetime info in file name), so that data files shared
+        # by several configurations are listed only once
+        unique_config_dict = {}
+        for signal_id, config, config_type in config_list:
+            # check number of elements in configuration
+            check_configuration(signal_id, config, config_type)
+
+            unique_config_dict.setdefault(
+                tuple(config[:5]), [signal_id, config, config_type]
+            )
+
+        # get distinct data directories, so that a directory where several
+        # configurations look for files (e.g. signals and intervals with
+        # different patterns) is listed only once
+        data_dir_list = list(dict.fromkeys(
+            config_key[0] for config_key in unique_config_dict.keys()
+        ))
+
+        # get list of data files for all distinct configurations
+        # (parallelization to improve performance, directory listings are
+        # independent from each other)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(8, len(unique_config_dict)))
+        ) as executor:
+            # list data directories
+            name_list_dict = dict(zip(data_dir_list, executor.map(
+                data_loader.get_directory_name_list, data_dir_list
+            )))
+
+            # get data files for each configuration
+            data_list_dict = dict(zip(
+                unique_config_dict.keys(), executor.map(
+                    lambda config_item: self.get_path_list(
+                        *config_item,
+                        name_list=name_list_dict[config_item[1][0]],
+                        flag_check_configuration=False, **kwargs
+                    ), unique_config_dict.values()
                 )
+            ))
+
+        # loop on configurations (same order as in the input dictionaries)
+        for signal_id, config, config_type in config_list:
+            # get data files (copy since the list of paths is updated when
+            # synchronizing)
+            path_list, datetime_list = data_list_dict[tuple(config[:5])]
+            data_list = [list(path_list), list(datetime_list)]
 
-            self.signal_list_dict[signal_id] = signal_list_tmp
+            if config_type == "Interval":
+                self.interval_list_dict[signal_id].append(data_list)
+
+            else:
+                self.signal_list_dict[signal_id].append(data_list)
 
 
     # *********************************************************************** #
@@ -629,101 +842,277 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         # initialize list of beginning datetime for all modalities
         beg_datetime_list = []
 
-        # initialize list of ending datetime for all modalities
-        end_datetime_list = []
+        # initialize list of last data files for all modalities, each element
+        # is a list with the path to the last data file, its beginning
+        # datetime and the function for getting its duration
+        last_file_list = []
 
         # loop on cameras
-        for video_list in self.video_list_dict.values():
+        for path_list, datetime_list in self.video_list_dict.values():
             # get beginning datetime of the first video
-            beg_datetime_list.append(video_list[1][0])
+            beg_datetime_list.append(datetime_list[0])
 
-            # get ending datetime of the last video
-            duration = get_duration_video(video_list[0][-1])
-            end_datetime = video_list[1][-1] + timedelta(seconds=duration)
-            end_datetime_list.append(end_datetime)
+            # get last video
+            last_file_list.append(
+                [path_list[-1], datetime_list[-1], self.get_video_duration]
+            )
 
         # loop on signals
         for sig_id, signal_list_list in self.signal_list_dict.items():
-            for ite_sig, signal_list in enumerate(signal_list_list):
+            for ite_sig, (path_list, datetime_list) in enumerate(
+                signal_list_list
+            ):
                 # get beginning datetime of the signal
-                beg_datetime_list.append(signal_list[1][0])
+                beg_datetime_list.append(datetime_list[0])
 
                 # get info in order to compute duration of last signal file
                 _, _, _, _, _, key, freq, _ = signal_dict[sig_id][ite_sig]
 
-                # get frequency
-                freq = self.get_data_frequency(signal_list[0][-1], freq)
-
-                # get duration
-                duration = data_loader.get_data_duration(
-                    signal_list[0][-1], freq, key=key
-                )
+                # get frequency with the first data file, as done for
+                # synchronization, so that it is read only once in the case
+                # of a file attribute
+                freq = self.get_data_frequency(path_list[0], freq)
+
+                # get last signal file
+                last_file_list.append([
+                    path_list[-1], datetime_list[-1],
+                    partial(self.get_data_duration, freq=freq, key=key)
+                ])
+
+        # get durations of last data files (parallelization to improve
+        # performance, data files are read independently from each other)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(8, len(last_file_list)))
+        ) as executor:
+            duration_list = list(executor.map(
+                lambda last_file: last_file[2](last_file[0]), last_file_list
+            ))
+
+        # get ending timestamps of all modalities
+        end_timestamp_array = \
+            datetime_converter.convert_datetime_list_to_timestamp_array(
+                [last_file[1] for last_file in last_file_list]
+            ) + np.rint(np.array(duration_list, dtype=np.float64) * 1e6)
+
+        # get modalities beginning first and ending last
+        ite_beg = np.argmin(
+            datetime_converter.convert_datetime_list_to_timestamp_array(
+                beg_datetime_list
+            )
+        )
 
-                # get ending datetime of the last signal file
-                end_datetime = signal_list[1][-1] + timedelta(seconds=duration)
-                end_datetime_list.append(end_datetime)
+        ite_end = np.argmax(end_timestamp_array)
 
-        return min(beg_datetime_list), max(end_datetime_list)
+        return beg_datetime_list[ite_beg], last_file_list[ite_end][1] + \
+            timedelta(seconds=duration_list[ite_end])
 
 
     def process_synchronization_video(self):
         """
-        Creates temporary synchronization files for video modality (all
-        cameras)
+        Sets data for creating temporary synchronization files for video
+        modality (all cameras)
 
         It updates the attribute :attr:`.video_list_dict` with the paths to the
-        temporary synchronization files.
+        temporary synchronization files. The files are created when needed,
+        see :meth:`.create_synchronization_file`.
         """
 
         # loop on cameras
-        for video_id, video_list in self.video_list_dict.items():
-            # get list of videos paths
-            path_list = video_list[0]
+        for video_id, (path_list, beginning_datetime_list) in \
+                self.video_list_dict.items():
+            # set synchronization data (video durations are retrieved only
+            # when creating synchronization files)
+            synchro_path_list = self.set_synchronization_data(
+                video_id, "video", path_list, beginning_datetime_list,
+                self.get_video_duration
+            )
 
-            # get list of videos beginning datetime
-            beginning_datetime_list = video_list[1]
+            # update list of data paths
+            self.video_list_dict[video_id][0] = synchro_path_list
 
-            # get duration of of video files for first camera
-            # (parallelization to improve performance)
-            duration_list = []
 
-            # check number of videos
-            if len(path_list) > 10:
-                # parallelize
-                with ProcessPoolExecutor() as executor:
-                    for r in executor.map(get_duration_video, path_list):
-                        duration_list.append(r)
+    def get_data_duration(self, path, freq, key='', flag_interval=False):
+        """
+        Gets the duration of a data file (signal or intervals)
+
+        :param path: path to the data file
+        :type path: str
+        :param freq: data frequency, see second positional argument of
+            :meth:`.ViSiAnnoT.get_data_frequency`
+        :type freq: str or float
+        :param key: key to access the data (in case of .mat or .h5)
+        :type key: str
+        :param flag_interval: specify if data is intervals
+        :type flag_interval: bool
 
-            else:
-                for path in path_list:
-                    duration_list.append(get_duration_video(path))
-
-            # loop on video files
-            # initialize list of data files ending datetime
-            ending_datetime_list = [
-                bd + timedelta(seconds=du)
-                for bd, du in zip(beginning_datetime_list, duration_list)
-            ]
+        :returns: duration of the data file in seconds
+        :rtype: float
+        """
 
-            # create temporary synchronization files
-            synchro_path_list = self.create_synchronization_files(
-                video_id, "video", path_list, beginning_datetime_list,
-                ending_datetime_list
-            )
+        # get frequency
+        freq = self.get_data_frequency(path, freq)
 
-            # update list of data paths
-            self.video_list_dict[video_id][0] = synchro_path_list
+        return self.get_cached_duration(
+            path, data_loader.get_data_duration, freq, key, flag_interval
+        )
+
+
+    def get_video_duration(self, path):
+        """
+        Gets the duration of a video file
+
+        :param path: path to the video file
+        :type path: str
+
+        :returns: duration of the video file in seconds
+        :rtype: float
+        """
+
+        return self.get_cached_duration(path, get_duration_video)
+
+
+    def get_file_info(self, path):
+        """
+        Gets the size and the modification time of a data file, it is taken
+        from :attr:`.file_info_dict` if the data file has already been
+        accessed
+
+        :param path: path to the data file
+        :type path: str
+
+        :returns: size (in bytes) and modification time (in nanoseconds) of
+            the data file, ``None`` if the data file cannot be accessed
+        :rtype: tuple
+        """
+
+        if path not in self.file_info_dict:
+            try:
+                stat = os.stat(path)
+                self.file_info_dict[path] = (stat.st_size, stat.st_mtime_ns)
+
+            # file not found
+            except OSError:
+                self.file_info_dict[path] = None
+
+        return self.file_info_dict[path]
+
+
+    def get_cached_duration(self, path, duration_function, *args):
+        """
+        Gets the duration of a data file, it is taken from
+        :attr:`.duration_cache_dict` if the data file has not changed since
+        its duration was retrieved
+
+        :param path: path to the data file
+        :type path: str
+        :param duration_function: function for getting the duration of the
+            data file, with the path to the data file as first positional
+            argument
+        :type duration_function: function
+        :param args: other positional arguments of ``duration_function``, they
+            are also used to identify the duration in
+            :attr:`.duration_cache_dict`
+
+        :returns: duration of the data file in seconds
+        :rtype: float
+        """
+
+        # get size and modification time of the data file
+        file_info = self.get_file_info(path)
+
+        # file not found, duration not stored
+        if file_info is None:
+            return duration_function(path, *args)
+
+        # check if duration already retrieved for the same data file
+        cache_key = (path,) + args
+        cache_value = self.duration_cache_dict.get(cache_key)
+        if cache_value is not None and cache_value[0] == file_info:
+            return cache_value[1]
+
+        # get duration
+        duration = duration_function(path, *args)
+
+        # store duration
+        self.duration_cache_dict[cache_key] = (file_info, duration)
+        self.flag_duration_cache_update = True
+
+        return duration
+
+
+    def load_duration_cache(self):
+        """
+        Loads the durations of data files retrieved in a previous launch of
+        the long recording, see :attr:`.duration_cache_dict`
+
+        The JSON file ``.duration_cache`` in :attr:`.synchro_dir` contains a
+        list of rows ``[path, args, size, mtime_ns, duration]``, see
+        :meth:`.save_duration_cache`. If it does not exist or cannot be read,
+        then :attr:`.duration_cache_dict` is empty.
+        """
+
+        try:
+            with open(
+                os.path.join(self.synchro_dir, ".duration_cache"), 'r'
+            ) as f:
+                self.duration_cache_dict = {
+                    (path,) + tuple(args): ((size, mtime_ns), duration)
+                    for path, args, size, mtime_ns, duration in json.load(f)
+                }
+
+        except Exception:
+            self.duration_cache_dict = {}
+
+
+    def save_duration_cache(self):
+        """
+        Saves the durations of the data files of the long recording in the
+        file ``.duration_cache`` in :attr:`.synchro_dir`, see
+        :attr:`.duration_cache_dict`
+
+        The file is written only if durations have been retrieved since it was
+        loaded. Durations of data files that are not in the long recording
+        anymore are discarded. It is a JSON list of rows
+        ``[path, args, size, mtime_ns, duration]``.
+        """
+
+        # check if any update
+        if not self.flag_duration_cache_update:
+            return
+
+        # get paths to the data files of the long recording
+        path_set = set()
+        for synchro_data in self.synchro_data_dict.values():
+            path_set.update(synchro_data[1])
+
+        # write to a temporary file and then rename it, so that the file is
+        # never partially written
+        cache_path = os.path.join(self.synchro_dir, ".duration_cache")
+        with open(cache_path + ".tmp", 'w') as f:
+            json.dump([
+                [
+                    cache_key[0], list(cache_key[1:]), file_info[0],
+                    file_info[1], duration
+                ] for cache_key, (file_info, duration)
+                in self.duration_cache_dict.items() if cache_key[0] in path_set
+            ], f, default=float)
+
+        os.replace(cache_path + ".tmp", cache_path)
+
+        self.flag_duration_cache_update = False
 
 
     def process_synchronization_single_widget(
         self, signal_id, flag_interval=False
     ):
         """
-        Creates temporary synchronization files for signals or intervals in a
-        specific widget
+        Sets data for creating temporary synchronization files for signals or
+        intervals in a specific widget
 
         It updates the attributes :attr:`.signal_list_dict` and/or
-        :attr:`.interval_list_dict` with the paths to synchronization files
+        :attr:`.interval_list_dict` with the paths to synchronization files.
+        The files are created when needed, see
+        :meth:`.create_synchronization_file`.
 
         :param signal_id: widget identifier (must be a key in
             :attr:`.signal_list_dict`)
@@ -758,25 +1147,10 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
             path_list, beginning_datetime_list = data_info
             _, _, _, key, freq, _ = config
 
-            # initialize list of data files ending datetime
-            ending_datetime_list = []
-
-            # loop on data paths
-            for path, beginning_datetime in zip(
-                path_list, beginning_datetime_list
-            ):
-                # get frequency
-                freq = self.get_data_frequency(path, freq)
-
-                # get data file duration
-                duration = data_loader.get_data_duration(
-                    path, freq, key=key, flag_interval=flag_interval
-                )
-
-                # get ending datetime
-                ending_datetime_list.append(
-                    beginning_datetime + timedelta(seconds=duration)
-                )
+            # get frequency with the first data file, it is then used for all
+            # data files
+            if len(path_list) > 0:
+                freq = self.get_data_frequency(path_list[0], freq)
 
             # get synchronization files output format
             if freq == 0:
@@ -784,11 +1158,16 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
 
             else:
                 output_fmt = "1D"
-            
-            # create temporary synchronization files
-            synchro_path_list = self.create_synchronization_files(
+
+            # set synchronization data (data durations are retrieved only when
+            # creating synchronization files)
+            synchro_path_list = self.set_synchronization_data(
                 "%s-%s" % (signal_id, ite_sig), output_fmt, path_list,
-                beginning_datetime_list, ending_datetime_list,
+                beginning_datetime_list,
+                partial(
+                    self.get_data_duration, freq=freq, key=key,
+                    flag_interval=flag_interval
+                )
             )
 
             # check if interval data
@@ -799,7 +1178,7 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
                 # update list of data paths
                 self.interval_list_dict[signal_id_orig][ite_sig][0] = \
                     synchro_path_list
-            
+
             else:
                 # update list of data paths
                 self.signal_list_dict[signal_id][ite_sig][0] = \
@@ -808,12 +1187,18 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
 
     def process_synchronization_all(self):
         """
-        Creates temporary synchronization files for all videos, signals and
-        intervals
-        
+        Sets data for creating temporary synchronization files for all
+        videos, signals and intervals
+
         It updates the attributes :attr:`.video_list_dict`,
         :attr:`.signal_list_dict` and :attr:`.interval_list_dict` with the
         paths to temporary synchronization files.
+
+        The temporary synchronization files are not created here, they are
+        created when the corresponding file in the long recording is loaded
+        (see :meth:`.process_synchronization_current_file`). So data files
+        durations are only retrieved for the files in the long recording that
+        are actually displayed.
         """
 
         # video synchronization
@@ -822,7 +1207,7 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         # loop on signal widgets
         for signal_id in self.signal_list_dict.keys():
             # check if any interval in the current widget
-            if signal_id in self.interval_list_dict.keys():
+            if signal_id in self.interval_list_dict:
                 self.process_synchronization_single_widget(
                     signal_id, flag_interval=True
                 )
@@ -830,19 +1215,149 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
             self.process_synchronization_single_widget(signal_id)
 
 
-    def create_synchronization_files(
+    def get_synchronization_hash(self):
+        """
+        Gets a hash of the inputs of the synchronization
+
+        The inputs are the configurations, the data files (paths, beginning
+        datetimes, sizes and modification times, see :meth:`.get_file_info`),
+        the reference frequency and the splitting of the long recording. It
+        must be called before :meth:`.process_synchronization_all`, since it
+        uses the paths to the data files in :attr:`.video_list_dict`,
+        :attr:`.signal_list_dict` and :attr:`.interval_list_dict`.
+
+        :returns: hexadecimal digest
+        :rtype: str
+        """
+
+        # get data files sizes and modification times
+        stat_list = []
+        for data_list_dict in (
+            {key: [value] for key, value in self.video_list_dict.items()},
+            self.signal_list_dict, self.interval_list_dict
+        ):
+            for data_list_list in data_list_dict.values():
+                for path_list, _ in data_list_list:
+                    stat_list.extend(
+                        [self.get_file_info(path) for path in path_list]
+                    )
+
+        synchro_input = (
+            self.video_config_dict, self.signal_config_dict,
+            self.interval_config_dict, self.video_list_dict,
+            self.signal_list_dict, self.interval_list_dict, stat_list,
+            self.fps, self.ref_beg_datetime_list,
+            self.temporal_range_duration_split,
+            self.temporal_range_duration_last
+        )
+
+        return sha256(repr(synchro_input).encode()).hexdigest()
+
+
+    def set_synchronization_directory(self):
+        """
+        Prepares the directory :attr:`.synchro_dir` where to save temporary
+        synchronization files
+
+        A hash of the synchronization inputs (see
+        :meth:`.get_synchronization_hash`) is stored in the file
+        ``.synchro_hash`` of the directory. If the directory already contains
+        the same hash, then the temporary synchronization files are kept and
+        reused when needed (it sets :attr:`.flag_synchro_reuse` to ``True``).
+        Otherwise, the files of the directory are deleted and the new hash is
+        stored.
+
+        It must be called before :meth:`.process_synchronization_all`.
+        """
+
+        # get hash of synchronization inputs
+        synchro_hash = self.get_synchronization_hash()
+        hash_path = os.path.join(self.synchro_dir, ".synchro_hash")
+
+        # create directory
+        if not os.path.isdir(self.synchro_dir):
+            os.mkdir(self.synchro_dir)
+
+        else:
+            # check if synchronization files are up to date
+            if os.path.isfile(hash_path):
+                with open(hash_path, 'r') as f:
+                    self.flag_synchro_reuse = f.read() == synchro_hash
+
+            # delete files that are not up to date (parallelization to improve
+            # performance, there might be thousands of files), durations of
+            # data files are kept since they are checked when used (see
+            # get_cached_duration)
+            if not self.flag_synchro_reuse:
+                with os.scandir(self.synchro_dir) as it:
+                    path_list = [
+                        entry.path for entry in it if entry.is_file()
+                        and entry.name != ".duration_cache"
+                    ]
+
+                with ThreadPoolExecutor(
+                    max_workers=max(1, min(16, len(path_list)))
+                ) as executor:
+                    # consume results so that exceptions are raised
+                    list(executor.map(os.remove, path_list))
+
+        # store hash
+        if not self.flag_synchro_reuse:
+            with open(hash_path, 'w') as f:
+                f.write(synchro_hash)
+
+
+    def get_synchronization_path_prefix(self, data_name):
+        """
+        Gets the common prefix of the paths to the temporary synchronization
+        files of a modality
+
+        The path to a temporary synchronization file is the prefix followed
+        by the beginning datetime of the file in the long recording (see
+        :attr:`.ref_beg_datetime_str_list`) and the extension ``.txt``.
+
+        :param data_name: modality name
+        :type data_name: str
+
+        :returns: prefix of the paths to the temporary synchronization files
+        :rtype: str
+        """
+
+        return os.path.join(self.synchro_dir, "%s_%s_" % (
+            os.path.basename(self.synchro_dir), data_name
+        ))
+
+
+    def get_synchronization_path(self, data_name, ite_file):
+        """
+        Gets the path to a temporary synchronization file
+
+        :param data_name: modality name
+        :type data_name: str
+        :param ite_file: index of the file in the long recording
+        :type ite_file: int
+
+        :returns: path to the temporary synchronization file
+        :rtype: str
+        """
+
+        return "%s%s.txt" % (
+            self.get_synchronization_path_prefix(data_name),
+            self.ref_beg_datetime_str_list[ite_file]
+        )
+
+
+    def set_synchronization_data(
         self, data_name, output_fmt, data_path_list,
-        data_beginning_datetime_list, data_ending_datetime_list
+        data_beginning_datetime_list, duration_function
     ):
         """
-        Creates temporary synchronization files for a given modality
+        Sets data for creating temporary synchronization files for a given
+        modality
 
-        The reference for synchronization is given by
-        :attr:`.ref_beg_datetime_list` and
-        :attr:`.temporal_range_duration_split`. A synchronization file is
-        created for each element of the list :attr:`.ref_beg_datetime_list`.
-
-        See :ref:`synchro` for an example of temporary synchronization files.
+        It updates the attribute :attr:`.synchro_data_dict`. The temporary
+        synchronization files are created later with
+        :meth:`.create_synchronization_file`.
 
         :param data_name: modality name (used for the output path to temporary
             synchronization file)
@@ -850,152 +1365,415 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         :param output_fmt: synchronization format in the temporary files,
             either "1D", "2D" or anything else, see :ref:`synchro` for details
         :type output_fmt: str
-        :param data_path_list: paths to the data files to synchronize
+        :param data_path_list: paths to the data files to synchronize, sorted
+            by chronological order
         :type data_path_list: list
         :param data_beginning_datetime_list: instances of datetime.datetime
             with the beginning datetime of each data file to synchronize
         :type data_beginning_datetime_list: list
-        :param data_ending_datetime_list: instances of datetime.datetime with
-            the ending datetime of each data file to synchronize, same length
-            as ``data_beginning_datetime_list``
-        :type data_ending_datetime_list: list
+        :param duration_function: function with one positional argument (path
+            to a data file) that returns the duration of the data file in
+            seconds
+        :type duration_function: function
 
-        :returns: paths to the created synchronization files
+        :returns: paths to the temporary synchronization files (one for each
+            file in the long recording)
         :rtype: list
         """
 
-        # remove empty data files (where beginning and ending datetimes are the
-        # same)
-        inds_to_remove = []
-        for ite_file, (beginning_datetime, ending_datetime) in enumerate(zip(
-            data_beginning_datetime_list, data_ending_datetime_list
-        )):
-            duration = (ending_datetime - beginning_datetime).total_seconds()
-            if duration == 0:
-                inds_to_remove.append(ite_file)
-
-        data_beginning_datetime_list = list(np.delete(
-            np.array(data_beginning_datetime_list), inds_to_remove
-        ))
+        # get beginning timestamps of data files
+        data_beginning_timestamp_array = \
+            datetime_converter.convert_datetime_list_to_timestamp_array(
+                data_beginning_datetime_list
+            ).astype(np.float64)
+
+        # get ranges of data files beginning in the temporal range of each
+        # file in the long recording (data files are sorted, so all ranges
+        # are retrieved at once by binary search)
+        data_file_range_array = np.stack((
+            np.searchsorted(
+                data_beginning_timestamp_array, self.ref_beg_timestamp_array,
+                side="left"
+            ),
+            np.searchsorted(
+                data_beginning_timestamp_array, self.ref_end_timestamp_array,
+                side="right"
+            )
+        ), axis=1)
 
-        data_ending_datetime_list = list(np.delete(
-            np.array(data_ending_datetime_list), inds_to_remove
-        ))
+        # beginning and ending datetimes are stored as arrays of timestamps
+        # (ending timestamps are retrieved when needed)
+        self.synchro_data_dict[data_name] = [
+            output_fmt, data_path_list, data_beginning_timestamp_array,
+            np.full(len(data_path_list), np.nan), duration_function,
+            data_file_range_array
+        ]
 
-        data_path_list = list(np.delete(
-            np.array(data_path_list), inds_to_remove
-        ))
+        # get paths to temporary synchronization files (same as
+        # get_synchronization_path, with the prefix computed only once)
+        path_prefix = self.get_synchronization_path_prefix(data_name)
 
-        # initialize list of synchronization files names
-        synchro_path_list = []
+        return [
+            "%s%s.txt" % (path_prefix, ref_datetime_str)
+            for ref_datetime_str in self.ref_beg_datetime_str_list
+        ]
 
-        # loop on beginning datetimes of reference data files
-        for ite, ref_datetime in enumerate(self.ref_beg_datetime_list):
-            # get temporal range duration of the file in the long recording
-            if ite < len(self.ref_beg_datetime_list) - 1:
-                temporal_range_duration = self.temporal_range_duration_split
 
-            else:
-                temporal_range_duration = self.temporal_range_duration_last
-
-            # compute difference of beginning datetimes between reference and
-            # signal
-            start_data_diff_array = np.array([
-                (beg_rec - ref_datetime).total_seconds()
-                for beg_rec in data_beginning_datetime_list
-            ])
-
-            # get signal files sharing temporality with reference data file
-            data_file_id_list = np.intersect1d(
-                np.where(start_data_diff_array >= 0)[0],
-                np.where(start_data_diff_array <= temporal_range_duration)[0]
+    def get_synchronization_ending_timestamps(
+        self, data_name, data_file_id_array
+    ):
+        """
+        Gets the ending timestamps of data files to synchronize
+
+        The durations of the data files are retrieved only the first time
+        (see :meth:`.set_synchronization_ending_timestamps`), then the ending
+        timestamps are stored in :attr:`.synchro_data_dict`.
+
+        :param data_name: modality name (key in :attr:`.synchro_data_dict`)
+        :type data_name: str
+        :param data_file_id_array: indexes of the data files in the list of
+            data files of the modality
+        :type data_file_id_array: numpy array
+
+        :returns: ending timestamps of the data files in microseconds
+        :rtype: numpy array
+        """
+
+        # get ending timestamps of the modality
+        data_ending_timestamp_array = self.synchro_data_dict[data_name][3]
+
+        # get indexes of data files whose ending timestamp is not computed yet
+        missing_id_array = data_file_id_array[
+            np.isnan(data_ending_timestamp_array[data_file_id_array])
+        ]
+
+        # compute missing ending timestamps
+        if missing_id_array.shape[0] > 0:
+            self.set_synchronization_ending_timestamps(
+                {data_name: missing_id_array}
             )
 
-            # check if there is a signal file beginning before reference data
-            # file
-            before_ref_data_array = np.where(start_data_diff_array < 0)[0]
-            if before_ref_data_array.shape[0] > 0:
-                # check length of signal file beginning before reference data
+        return data_ending_timestamp_array[data_file_id_array]
+
+
+    def set_synchronization_ending_timestamps(self, data_file_id_dict):
+        """
+        Computes the ending timestamps of data files to synchronize, for one
+        or several modalities at once
+
+        The durations of the data files of all modalities are retrieved in
+        parallel with :attr:`.duration_executor`. The ending timestamps are
+        stored in :attr:`.synchro_data_dict`.
+
+        :param data_file_id_dict: key is a modality name (key in
+            :attr:`.synchro_data_dict`), value is a numpy array with the
+            indexes of the data files whose ending timestamp must be computed
+        :type data_file_id_dict: dict
+        """
+
+        # get durations to retrieve for all modalities (function and path)
+        duration_request_list = []
+        for data_name, data_file_id_array in data_file_id_dict.items():
+            _, data_path_list, _, _, duration_function, _ = \
+                self.synchro_data_dict[data_name]
+
+            duration_request_list += [
+                (duration_function, data_path_list[data_file_id])
+                for data_file_id in data_file_id_array.tolist()
+            ]
+
+        # get durations of data files (parallelization to improve performance,
+        # data files are read independently from each other)
+        if len(duration_request_list) > 1:
+            duration_list = list(self.duration_executor.map(
+                lambda duration_request: duration_request[0](
+                    duration_request[1]
+                ), duration_request_list
+            ))
+
+        elif len(duration_request_list) == 1:
+            duration_function, path = duration_request_list[0]
+            duration_list = [duration_function(path)]
+
+        else:
+            return
+
+        duration_array = np.array(duration_list, dtype=np.float64)
+
+        # loop on modalities
+        ite_duration = 0
+        for data_name, data_file_id_array in data_file_id_dict.items():
+            _, _, data_beginning_timestamp_array, \
+                data_ending_timestamp_array, _, _ = \
+                self.synchro_data_dict[data_name]
+
+            # compute ending timestamps (durations are rounded to the
+            # microsecond as with datetime.timedelta)
+            nb_durations = data_file_id_array.shape[0]
+            data_ending_timestamp_array[data_file_id_array] = \
+                data_beginning_timestamp_array[data_file_id_array] + \
+                np.rint(
+                    duration_array[ite_duration:ite_duration + nb_durations] *
+                    1e6
+                )
+
+            ite_duration += nb_durations
+
+
+    def check_synchronization_file(self, data_name, ite_file):
+        """
+        Checks if a temporary synchronization file is already created (or
+        created during a previous session with the same synchronization
+        inputs, see :meth:`.set_synchronization_directory`)
+
+        :param data_name: modality name (key in :attr:`.synchro_data_dict`)
+        :type data_name: str
+        :param ite_file: index of the file in the long recording
+        :type ite_file: int
+
+        :returns: specify if the synchronization file is already created
+        :rtype: bool
+        """
+
+        # get synchronization file name
+        tmp_path = self.get_synchronization_path(data_name, ite_file)
+
+        return tmp_path in self.synchro_lines_dict or (
+            self.flag_synchro_reuse and os.path.isfile(tmp_path)
+        )
+
+
+    def create_synchronization_file(self, data_name, ite_file):
+        """
+        Creates a temporary synchronization file for a given modality and a
+        given file in the long recording, if not already created (see also
+        :meth:`.set_synchronization_directory`)
+
+        The data to synchronize is given by :attr:`.synchro_data_dict` (see
+        :meth:`.set_synchronization_data`). The reference for synchronization
+        is given by :attr:`.ref_beg_datetime_list` and
+        :attr:`.temporal_range_duration_split`.
+
+        See :ref:`synchro` for an example of temporary synchronization files.
+
+        The lines of the synchronization file are also stored in the
+        attribute :attr:`.synchro_lines_dict`. If there is no data of the
+        modality in the file of the long recording, the synchronization file
+        is not written on disk (only the empty list of lines is stored).
+
+        :param data_name: modality name (key in :attr:`.synchro_data_dict`)
+        :type data_name: str
+        :param ite_file: index of the file in the long recording
+        :type ite_file: int
+
+        :returns: path to the synchronization file
+        :rtype: str
+        """
+
+        # get synchronization file name
+        tmp_path = self.get_synchronization_path(data_name, ite_file)
+
+        # check if synchronization file already created
+        if self.check_synchronization_file(data_name, ite_file):
+            return tmp_path
+
+        # get data to synchronize
+        output_fmt, data_path_list, data_beginning_timestamp_array, \
+            data_ending_timestamp_array, _, data_file_range_array = \
+            self.synchro_data_dict[data_name]
+
+        # get beginning timestamp of reference data file
+        ref_timestamp = self.ref_beg_timestamp_array[ite_file]
+
+        # get range of data files beginning in the temporal range of the
+        # reference data file
+        first_id, stop_id = data_file_range_array[ite_file]
+
+        # look for the last non-empty data file beginning before reference
+        # data file (data files in between are empty)
+        for data_file_id in range(first_id - 1, -1, -1):
+            ending_timestamp = self.get_synchronization_ending_timestamps(
+                data_name, np.array([data_file_id])
+            )[0]
+
+            if ending_timestamp != \
+                    data_beginning_timestamp_array[data_file_id]:
+                # check length of data file beginning before reference data
                 # file
-                if data_ending_datetime_list[before_ref_data_array[-1]] > \
-                        ref_datetime:
-                    # update list of signal files sharing temporality with
+                if ending_timestamp > ref_timestamp:
+                    # update range of data files sharing temporality with
                     # reference data file
-                    data_file_id_list = np.hstack((
-                        before_ref_data_array[-1], data_file_id_list
+                    first_id = data_file_id
+
+                break
+
+        # get data files sharing temporality with reference data file
+        data_file_id_array = np.arange(first_id, stop_id)
+
+        # remove empty data files (where beginning and ending datetimes are
+        # the same)
+        data_file_id_array = data_file_id_array[
+            self.get_synchronization_ending_timestamps(
+                data_name, data_file_id_array
+            ) != data_beginning_timestamp_array[data_file_id_array]
+        ]
+
+        # get data files paths and beginning offsets with respect to reference
+        # data file
+        # (indexes are converted to a list once, so that the list of paths
+        # is not indexed with numpy integers)
+        path_list = [
+            data_path_list[ind] for ind in data_file_id_array.tolist()
+        ]
+        start_sec_array = (
+            data_beginning_timestamp_array[data_file_id_array] - ref_timestamp
+        ) / 1e6
+
+        # get delimiter once, since it is used for each line
+        delimiter = self.synchro_delimiter
+
+        # initialize list of lines of the synchronization file
+        lines = []
+
+        # check output format
+        if output_fmt == "1D":
+            if len(path_list) > 0:
+                # check if first data file begins before the reference
+                # temporal range
+                if start_sec_array[0] <= 0:
+                    lines.append("%s%s%f\n" % (
+                        path_list[0], delimiter,
+                        -start_sec_array[0]
                     ))
 
-            # get synchronization file name
-            tmp_path = "%s/%s_%s_%s.txt" % (
-                self.synchro_dir, os.path.basename(self.synchro_dir),
-                data_name, ref_datetime.strftime("%Y-%m-%dT%H-%M-%S")
+                else:
+                    lines.append("None%s%f\n" % (
+                        delimiter, start_sec_array[0]
+                    ))
+
+                    lines.append("%s\n" % path_list[0])
+
+                # compute temporal gaps between beginning of data files and
+                # ending of previous data files
+                gap_array = (
+                    data_beginning_timestamp_array[data_file_id_array[1:]] -
+                    data_ending_timestamp_array[data_file_id_array[:-1]]
+                ) / 1e6
+
+                # check if any gap (usually not, data files are contiguous)
+                if np.any(gap_array > 0):
+                    for data_path, gap in zip(
+                        path_list[1:], gap_array.tolist()
+                    ):
+                        if gap > 0:
+                            lines.append("None%s%f\n" % (
+                                delimiter, gap
+                            ))
+
+                        lines.append("%s\n" % data_path)
+
+                else:
+                    lines.extend(
+                        ["%s\n" % data_path for data_path in path_list[1:]]
+                    )
+
+        elif output_fmt == "2D":
+            lines = [
+                "%s%s%f\n" % (data_path, delimiter, start_sec)
+                for data_path, start_sec in zip(
+                    path_list, start_sec_array.tolist()
+                )
+            ]
+
+        else:
+            # compute ending offsets with respect to reference data file,
+            # bounded by the ending of the reference data file
+            end_sec_array = (np.minimum(
+                data_ending_timestamp_array[data_file_id_array],
+                self.ref_end_timestamp_array[ite_file]
+            ) - ref_timestamp) / 1e6
+
+            lines = [
+                "%s%s%f%s%f\n" % (
+                    data_path, delimiter, start_sec,
+                    delimiter, end_sec
+                ) for data_path, start_sec, end_sec in zip(
+                    path_list, start_sec_array.tolist(),
+                    end_sec_array.tolist()
+                )
+            ]
+
+        # keep lines in memory, so that the file does not need to be read
+        # when loading data
+        self.synchro_lines_dict[tmp_path] = lines
+
+        # write synchronization file in a separate thread (not written if
+        # empty, in case of reuse it is then recomputed)
+        if len(lines) > 0:
+            self.synchro_executor.submit(
+                self.write_synchronization_file, tmp_path, lines
             )
 
-            synchro_path_list.append(tmp_path)
-            with open(tmp_path, 'w') as f:
-                for ite_id, data_file_id in enumerate(data_file_id_list):
-                    start_sec = start_data_diff_array[data_file_id]
-                    data_path = data_path_list[data_file_id]
-
-                    # check output format
-                    if output_fmt == "1D":
-                        # first data file
-                        if ite_id == 0:
-                            # check if data file begins before the reference
-                            # temporal range
-                            if start_sec <= 0:
-                                f.write("%s%s%f\n" % (
-                                    data_path, self.synchro_delimiter,
-                                    -start_sec
-                                ))
-
-                            else:
-                                f.write("None%s%f\n%s\n" % (
-                                    self.synchro_delimiter, start_sec,
-                                    data_path
-                                ))
-
-                        else:
-                            # get beginning datetime of data file
-                            beginning_datetime = \
-                                data_beginning_datetime_list[data_file_id]
-
-                            # get ending datetime of previous data file
-                            prev_datetime = data_ending_datetime_list[
-                                data_file_id_list[ite_id - 1]
-                            ]
-
-                            # compute temporal gap with previous data file
-                            gap = (
-                                beginning_datetime - prev_datetime
-                            ).total_seconds()
-                            
-                            if gap > 0:
-                                f.write("None%s%f\n" % (
-                                    self.synchro_delimiter, gap
-                                ))
-
-                            f.write("%s\n" % data_path)
-
-                    elif output_fmt == "2D":
-                        f.write("%s%s%f\n" % (
-                            data_path, self.synchro_delimiter, start_sec
-                        ))
-
-                    else:
-                        end_sec = (
-                            data_ending_datetime_list[data_file_id] -
-                            ref_datetime
-                        ).total_seconds()
-
-                        end_sec = min(end_sec, temporal_range_duration)
-
-                        f.write("%s%s%f%s%f\n" % (
-                            data_path, self.synchro_delimiter,
-                            start_sec, self.synchro_delimiter, end_sec
-                        ))
-
-        return synchro_path_list
+        return tmp_path
+
+
+    @staticmethod
+    def write_synchronization_file(path, lines):
+        """
+        Writes a temporary synchronization file
+
+        The lines are first written in a temporary file which is then renamed,
+        so that an incomplete synchronization file cannot be reused by a later
+        session (see :meth:`.set_synchronization_directory`).
+
+        :param path: path to the synchronization file
+        :type path: str
+        :param lines: lines of the synchronization file (with line breaks)
+        :type lines: list
+        """
+
+        # encode all lines at once (same encoding as default text mode, used
+        # for reading the file with data_loader.get_txt_lines) and write them
+        # in binary mode, so that there is no text layer
+        content = ''.join(lines).encode(getpreferredencoding(False))
+        with open("%s.tmp" % path, 'wb') as f:
+            f.write(content)
+
+        os.replace("%s.tmp" % path, path)
+
+
+    def process_synchronization_current_file(self):
+        """
+        Creates the temporary synchronization files of all modalities for the
+        current file in the long recording (given by :attr:`.ite_file`), if
+        not already created
+
+        The durations of the data files needed for all modalities are
+        retrieved at once with :meth:`.set_synchronization_ending_timestamps`.
+        """
+
+        # get data files whose ending timestamps are needed for the
+        # synchronization files to create, i.e. data files beginning in the
+        # current file and the data file just before (see
+        # create_synchronization_file)
+        data_file_id_dict = {}
+        for data_name, synchro_data in self.synchro_data_dict.items():
+            if not self.check_synchronization_file(data_name, self.ite_file):
+                first_id, stop_id = synchro_data[5][self.ite_file]
+                data_file_id_array = np.arange(max(first_id - 1, 0), stop_id)
+                data_file_id_array = data_file_id_array[
+                    np.isnan(synchro_data[3][data_file_id_array])
+                ]
+
+                if data_file_id_array.shape[0] > 0:
+                    data_file_id_dict[data_name] = data_file_id_array
+
+        # retrieve durations of these data files for all modalities at once
+        self.set_synchronization_ending_timestamps(data_file_id_dict)
+
+        # create synchronization files
+        for data_name in self.synchro_data_dict.keys():
+            self.create_synchronization_file(data_name, self.ite_file)
 
 
     # *********************************************************************** #
@@ -1013,7 +1791,9 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
         recording to provide to :class:`.ViSiAnnoT`
 
         It also sets :attr:`.temporal_range_duration` according to the value of
-        :attr:`.ite_file`
+        :attr:`.ite_file` and it creates the temporary synchronization files
+        of the current file if not already created (see
+        :meth:`.process_synchronization_current_file`).
 
         :returns:
             - **video_dict** (*dict*) -- video configuration
@@ -1021,32 +1801,38 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
             - **interval_dict** (*dict*) -- interval configuration
         """
 
-        video_dict = {}
-        for cam_id, (path_list, _) in self.video_list_dict.items():
-            video_dict[cam_id] = \
-                [path_list[self.ite_file]] + self.synchro_timestamp_config
-
-        signal_dict = {}
-        interval_dict = {}
-        for signal_id, data_info_list in self.signal_list_dict.items():
-            if signal_id in self.interval_list_dict.keys():
-                interval_dict[signal_id] = []
+        # create temporary synchronization files of the current file
+        self.process_synchronization_current_file()
+
+        # video configuration (one synchronization file per camera)
+        video_dict = {
+            cam_id: [path_list[self.ite_file]] + self.synchro_timestamp_config
+            for cam_id, (path_list, _) in self.video_list_dict.items()
+        }
+
+        # signal configuration (one synchronization file per sub-data, each
+        # list of synchronization files has one element for each file in the
+        # long recording)
+        signal_dict = {
+            signal_id: [
+                [path_list[self.ite_file]] + config
                 for (path_list, _), config in zip(
-                    self.interval_list_dict[signal_id],
-                    self.interval_config_dict[signal_id]
-                ):
-                    if self.ite_file < len(path_list):
-                        interval_dict[signal_id].append(
-                            [path_list[self.ite_file]] + config
-                        )
-
-            signal_dict[signal_id] = []
-            for (path_list, _), config in zip(
-                data_info_list, self.signal_config_dict[signal_id]
-            ):
-                signal_dict[signal_id].append(
-                    [path_list[self.ite_file]] + config
+                    data_info_list, self.signal_config_dict[signal_id]
+                )
+            ] for signal_id, data_info_list in self.signal_list_dict.items()
+        }
+
+        # interval configuration (only for widgets with signals, see
+        # process_synchronization_all)
+        interval_dict = {
+            signal_id: [
+                [path_list[self.ite_file]] + config
+                for (path_list, _), config in zip(
+                    data_info_list, self.interval_config_dict[signal_id]
                 )
+            ] for signal_id, data_info_list in self.interval_list_dict.items()
+            if signal_id in self.signal_list_dict
+        }
 
         if self.ite_file == self.nb_files - 1:
             self.temporal_range_duration = \
@@ -1156,8 +1942,11 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
             for video_id, data_video in self.video_data_dict.items():
                 self.wid_vid_dict[video_id].setDataVideo(data_video)
 
-            # set recording choice combo box
-            if self.file_selection_widget is not None:
+            # set recording choice combo box (only if not already set, e.g.
+            # when file selection is done with the combo box)
+            if self.file_selection_widget is not None and \
+                    self.file_selection_widget.combo_box.currentIndex() != \
+                    self.ite_file:
                 # to prevent the combo box callback method from being called
                 # (which would imply calling method change_file_in_long_rec
                 # twice if file selection not done with combo box), the combo
@@ -1169,7 +1958,9 @@ class ViSiAnnoTLongRec(ViSiAnnoT):
                 self.file_selection_widget.combo_box.blockSignals(False)
 
             # reset selected item of combo box for temporal range from cursor
-            if self.wid_from_cursor is not None:
+            # (only if not already reset)
+            if self.wid_from_cursor is not None and \
+                    self.wid_from_cursor.combo_box.currentIndex() != 0:
                 self.wid_from_cursor.combo_box.setCurrentIndex(0)
 
             return True
@@ -633,19 +633,27 @@ class AnnotEventWidget():
             annot_path, dtype=str, delimiter=" - ", ndmin=2
         ).flatten()
 
-        # loop on current annotation boundaries
-        diff_array = np.empty((0, len(annot_array_total)))
-        for annot_bound in [annot_datetime_0, annot_datetime_1]:
-            # compute difference with boundaries of existing annotations
-            diff_array_tmp = np.array([(
-                datetime_converter.convert_string_to_datetime(
-                    d, self.timestamp_format, **kwargs) - annot_bound
-            ).total_seconds() for d in annot_array_total])
-
-            # binarize difference array
-            diff_array = np.concatenate((
-                diff_array, np.where(diff_array_tmp > 0, 1, 0)[None, :]
-            ))
+        # convert boundaries of existing annotations to timestamps once
+        annot_timestamp_array = \
+            datetime_converter.convert_datetime_list_to_timestamp_array(
+                datetime_converter.convert_string_list_to_datetime(
+                    annot_array_total.tolist(), self.timestamp_format,
+                    **kwargs
+                )
+            )
+
+        # get timestamps of current annotation boundaries
+        bound_timestamp_array = \
+            datetime_converter.convert_datetime_list_to_timestamp_array(
+                [annot_datetime_0, annot_datetime_1]
+            )
+
+        # binarize difference with boundaries of existing annotations (one
+        # row per current annotation boundary)
+        diff_array = np.where(
+            annot_timestamp_array[None, :] > bound_timestamp_array[:, None],
+            1, 0
+        )
 
         # check if no overlap
         if np.sum(np.diff(diff_array, axis=0)) == 0:
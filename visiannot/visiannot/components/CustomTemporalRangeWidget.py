@@ -144,6 +144,12 @@ class CustomTemporalRangeWidget():
         pst = timezone(visi.time_zone)
         start_date_time = pst.localize(start_date_time)
 
+        # get start timestamp (microseconds)
+        start_timestamp = \
+            datetime_converter.convert_datetime_list_to_timestamp_array(
+                [start_date_time]
+            )[0]
+
         # get start frame
         start_frame = datetime_converter.convert_absolute_datetime_to_frame(
             start_date_time, visi.fps, visi.beginning_datetime
@@ -154,14 +160,12 @@ class CustomTemporalRangeWidget():
         if start_frame < 0 or start_frame >= visi.nframes:
             # check long recordings
             if visi.flag_long_rec:
-                # get recording id
-                start_ref_diff_array = np.array(
-                    [(beg_rec - start_date_time).total_seconds()
-                        for beg_rec in visi.ref_beg_datetime_list]
+                # get recording id (comparison of timestamps, see
+                # ViSiAnnoTLongRec.ref_beg_timestamp_array)
+                new_ite_file = np.flatnonzero(
+                    visi.ref_beg_timestamp_array > start_timestamp
                 )
 
-                new_ite_file = np.where(start_ref_diff_array > 0)[0]
-
                 if new_ite_file.shape[0] == 0:
                     flag_coherence = False
                     print(
@@ -169,7 +173,8 @@ class CustomTemporalRangeWidget():
                         "recordings"
                     )
 
-                elif new_ite_file.shape[0] == start_ref_diff_array.shape[0]:
+                elif new_ite_file.shape[0] == \
+                        visi.ref_beg_timestamp_array.shape[0]:
                     flag_coherence = False
                     print(
                         "wrong input: start time is below the beginning of "
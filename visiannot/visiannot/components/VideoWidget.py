@@ -119,10 +119,10 @@ class VideoWidget(pg.PlotWidget):
 
         data_video_list, path_list, frame_array = self.data_video_synchro
 
-        # get indexes of videos containing the current frame
-        video_inds = np.intersect1d(
-            np.where(frame_array[:, 0] <= frame_id)[0],
-            np.where(frame_array[:, 1] > frame_id)[0]
+        # get indexes of videos containing the current frame (single boolean
+        # mask, indexes are already sorted)
+        video_inds = np.flatnonzero(
+            (frame_array[:, 0] <= frame_id) & (frame_array[:, 1] > frame_id)
         )
 
         if len(video_inds) > 0: